@@ -158,8 +158,10 @@ class CircularGraphicRecord(GraphicRecord):
         """
         return min(0.25, 3.0 * self.radius / (1.0 + max_annotations_level))
 
-    def compute_padding(self, ax):
-        ax_width = ax.get_window_extent(ax.figure.canvas.get_renderer()).width
+    def compute_padding(self, ax, renderer=None):
+        if renderer is None:
+            renderer = ax.figure.canvas.get_renderer()
+        ax_width = ax.get_window_extent(renderer).width
         xmin, xmax = ax.get_xlim()
         result = self.labels_spacing * (xmax - xmin) / (1.0 * ax_width)
         return 2 * self.labels_spacing * (xmax - xmin) / (1.0 * ax_width)
\ No newline at end of file
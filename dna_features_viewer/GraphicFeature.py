@@ -1,4 +1,5 @@
-from copy import deepcopy
+_DEFAULT_FONTDICT = {"fontsize": 11}
+
 
 class GraphicFeature:
     """Genetic Feature to be plotted.
@@ -39,6 +40,24 @@ class GraphicFeature:
 
     feature_type = "feature"
 
+    __slots__ = (
+        "start",
+        "end",
+        "strand",
+        "label",
+        "color",
+        "linecolor",
+        "data",
+        "thickness",
+        "linewidth",
+        "box_linewidth",
+        "box_color",
+        "fontdict",
+        "html",
+        "open_left",
+        "open_right",
+    )
+
     def __init__(
         self,
         start=None,
@@ -68,17 +87,40 @@ class GraphicFeature:
         self.linewidth = linewidth
         self.box_linewidth = box_linewidth
         self.box_color = box_color
-        self.fontdict = dict(
-            [("fontsize", 11)] + list((fontdict or {}).items())
-        )
+        self.fontdict = dict(_DEFAULT_FONTDICT)
+        if fontdict is not None:
+            self.fontdict.update(fontdict)
         self.html = html
         self.open_left = open_left
         self.open_right = open_right
 
+    def _clone(self):
+        """Return a copy of the feature, with its own data and fontdict.
+
+        This is much faster than a deepcopy, which would also copy every
+        object stored in the feature's data. The attributes declared in the
+        ``__slots__`` of subclasses are copied too.
+        """
+        new = self.__class__.__new__(self.__class__)
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if hasattr(self, name):
+                    setattr(new, name, getattr(self, name))
+        if hasattr(self, "__dict__"):  # attributes of a subclass
+            new.__dict__.update(self.__dict__)
+        new.data = self.data.copy()
+        new.fontdict = self.fontdict.copy()
+        return new
+
     def split_in_two(self, x_coord=0):
         """Return two features by cutting this feature at x_coord."""
-        copy1 = deepcopy(self)
-        copy2 = deepcopy(self)
+        copy1 = self._clone()
+        copy2 = self._clone()
         copy1.end = x_coord
         copy2.start = x_coord + 1
         return copy1, copy2
@@ -92,7 +134,7 @@ class GraphicFeature:
         s, e = window
         if (s > self.end) or (e < self.start):
             return None
-        copy = deepcopy(self)
+        copy = self._clone()
         if s > self.start:
             copy.start = s
             copy.open_left = True
@@ -104,9 +146,15 @@ class GraphicFeature:
     def overlaps_with(self, other):
         """Return True iff the feature's location overlaps with feature `other`
         """
-        loc1, loc2 = (self.start, self.end), (other.start, other.end)
-        loc1, loc2 = sorted(loc1), sorted(loc2)
-        loc1, loc2 = sorted([loc1, loc2], key=lambda loc: loc[0])
+        if (self.start <= self.end) and (other.start <= other.end):
+            # Fast path for the common case of features with start <= end.
+            if self.start <= other.start:
+                return self.end > other.start
+            return other.end > self.start
+        loc1 = min(self.start, self.end), max(self.start, self.end)
+        loc2 = min(other.start, other.end), max(other.start, other.end)
+        if loc1[0] > loc2[0]:
+            loc1, loc2 = loc2, loc1
         return loc1[1] > loc2[0]
 
     @property
@@ -130,6 +178,6 @@ class GraphicFeature:
         )
 
     def __repr__(self):
-        return ("GF(%(label)s, %(start)d-%(end)d " % self.__dict__) + (
+        return ("GF(%s, %d-%d " % (self.label, self.start, self.end)) + (
             ")" if self.strand is None else "(%d))" % self.strand
         )
@@ -1,14 +1,31 @@
 import textwrap
+from functools import lru_cache
 
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 from Bio.SeqFeature import FeatureLocation, SeqFeature
-from Bio.Alphabet import DNAAlphabet
 
+try:
+    # Biopython < 1.78 needs an alphabet to write Genbank files.
+    from Bio.Alphabet import DNAAlphabet
+except ImportError:
+    DNAAlphabet = None
+
+from ..compute_features_levels import compute_features_levels
 from .matplotlib_plots import MatplotlibPlottableMixin
 from .bokeh_plots import BokehPlottableMixin
 
 
+@lru_cache(maxsize=4096)
+def _format_label_cached(label, max_label_length, max_line_length):
+    """Cut and wrap a label (memoized, as labels are formatted at each plot).
+    """
+    if len(label) > max_label_length:
+        label = label[: max_label_length - 1] + "…"
+    label = "\n".join(textwrap.wrap(label, max_line_length))
+    return label
+
+
 class GraphicRecord(MatplotlibPlottableMixin, BokehPlottableMixin):
     """Set of Genetic Features of a same DNA sequence, to be plotted together.
 
@@ -82,6 +99,24 @@ class GraphicRecord(MatplotlibPlottableMixin, BokehPlottableMixin):
         self.plots_indexing = plots_indexing
         self.labels_spacing = labels_spacing
 
+    @property
+    def sequence(self):
+        """The record's sequence (or None).
+
+        The sequence of a record obtained with ``crop()`` is extracted from
+        the original sequence the first time it is accessed.
+        """
+        if self._sequence_window is not None:
+            start, end = self._sequence_window
+            self._sequence = self._sequence[start:end]
+            self._sequence_window = None
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, sequence):
+        self._sequence = sequence
+        self._sequence_window = None
+
     @property
     def span(self):
         """Return the display span (start, end) accounting for first_index."""
@@ -107,8 +142,15 @@ class GraphicRecord(MatplotlibPlottableMixin, BokehPlottableMixin):
             for f in self.features
         ]
         if not isinstance(sequence, Seq):
-            sequence = Seq(sequence, alphabet=DNAAlphabet())
-        return SeqRecord(seq=sequence, features=features)
+            if DNAAlphabet is None:
+                sequence = Seq(str(sequence))
+            else:
+                sequence = Seq(str(sequence), alphabet=DNAAlphabet())
+        return SeqRecord(
+            seq=sequence,
+            features=features,
+            annotations={"molecule_type": "DNA"},
+        )
 
     def crop(self, window):
         s, e = window
@@ -116,17 +158,31 @@ class GraphicRecord(MatplotlibPlottableMixin, BokehPlottableMixin):
             raise ValueError("out-of-bound cropping")
         new_features = []
         for f in self.features:
-            cropped_feature = f.crop(window)
-            if cropped_feature is not None:  # = has ovelap with the window
-                new_features.append(cropped_feature)
+            if (s > f.end) or (e < f.start):
+                continue  # no overlap with the window, no need to call crop()
+            new_features.append(f.crop(window))
 
-        return GraphicRecord(
-            sequence=self.sequence[s:e] if self.sequence is not None else None,
+        cropped_record = GraphicRecord(
             sequence_length=e - s,
             features=new_features,
             feature_level_height=self.feature_level_height,
             first_index=self.first_index + s,
         )
+        if self._sequence is not None:
+            # The cropped record shares the full sequence and only extracts
+            # its subsequence if it is ever accessed.
+            offset = 0
+            if self._sequence_window is not None:
+                offset = self._sequence_window[0]
+            cropped_record._sequence = self._sequence
+            cropped_record._sequence_window = (offset + s, offset + e)
+        return cropped_record
+
+    def compute_features_levels(self):
+        """Return a dict {feature: level} giving the vertical level of each
+        of the record's features, so that no two overlapping features are on
+        the same level."""
+        return compute_features_levels(self.features)
 
     def determine_annotation_height(self, levels):
         """By default the ideal annotation level height is the same as the
@@ -164,12 +220,11 @@ class GraphicRecord(MatplotlibPlottableMixin, BokehPlottableMixin):
         self.features = new_features
 
     def _format_label(self, label, max_label_length=50, max_line_length=40):
-        if len(label) > max_label_length:
-            label = label[: max_label_length - 1] + "…"
-        label = "\n".join(textwrap.wrap(label, max_line_length))
-        return label
+        return _format_label_cached(label, max_label_length, max_line_length)
     
-    def compute_padding(self, ax):
-        ax_width = ax.get_window_extent(ax.figure.canvas.get_renderer()).width
+    def compute_padding(self, ax, renderer=None):
+        if renderer is None:
+            renderer = ax.figure.canvas.get_renderer()
+        ax_width = ax.get_window_extent(renderer).width
         xmin, xmax = ax.get_xlim()
         return self.labels_spacing * (xmax - xmin) / (1.0 * ax_width)
@@ -251,8 +251,11 @@ class MatplotlibPlottableMixin:
         overflowing = (x1 < feature.start) or (x2 > feature.end)
         return text, overflowing, nlines, (x1, x2), (y2 - y1)
 
-    def position_annotation(self, feature, ax, level, annotate_inline):
-        padding = self.compute_padding(ax)
+    def position_annotation(
+        self, feature, ax, level, annotate_inline, padding=None
+    ):
+        if padding is None:
+            padding = self.compute_padding(ax)
         if annotate_inline:
             text, overflowing, lines, (x1, x2), height = self.annotate_feature(
                 ax=ax,
@@ -328,7 +331,7 @@ class MatplotlibPlottableMixin:
         x_lim
           Horizontal axis limits to be set at the end.
         """
-        features_levels = compute_features_levels(self.features)
+        features_levels = self.compute_features_levels()
         for f in features_levels:
             features_levels[f] += level_offset
         max_level = (
@@ -348,6 +351,7 @@ class MatplotlibPlottableMixin:
         bbox = ax.get_window_extent(renderer)
         ax_height = bbox.height
         ideal_yspan = 0
+        padding = self.compute_padding(ax, renderer=renderer)
         for feature, level in features_levels.items():
             self.plot_feature(ax=ax, feature=feature, level=level)
             if feature.label is None:
@@ -356,7 +360,7 @@ class MatplotlibPlottableMixin:
                 x1,
                 x2,
             ), height = self.position_annotation(
-                feature, ax, level, annotate_inline
+                feature, ax, level, annotate_inline, padding=padding
             )
             # print (height)
             # nlines = len(feature.label.split("\n"))
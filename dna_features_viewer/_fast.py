@@ -0,0 +1,67 @@
+"""Numerical cores of the features levels computation.
+
+These functions only work on NumPy arrays with plain loops, so that they can
+be compiled with Numba when it is installed. Without Numba they run as
+regular Python functions.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for Numba's ``njit`` which leaves functions unchanged."""
+        return lambda function: function
+
+
+@njit(cache=True)
+def assign_levels(order, neighbors_indptr, neighbors, nlines, has_nlines):
+    """Return an array of levels with no collision between neighbor nodes.
+
+    Parameters
+    ----------
+
+    order
+      Array of the node indices, in the order in which they will receive
+      their level.
+
+    neighbors_indptr, neighbors
+      Neighborhoods of the graph in compressed form: the neighbors of node
+      ``i`` are ``neighbors[neighbors_indptr[i]:neighbors_indptr[i + 1]]``.
+
+    nlines, has_nlines
+      Arrays giving, for nodes with ``has_nlines`` True, the number of text
+      lines of the node (a node of N lines spans N/2 levels).
+    """
+    levels = np.full(len(order), -1, np.int64)
+    for node in order:
+        base_level = 0
+        collision = True
+        while collision:
+            collision = False
+            for k in range(neighbors_indptr[node], neighbors_indptr[node + 1]):
+                neighbor = neighbors[k]
+                level = levels[neighbor]
+                if level < 0:
+                    continue
+                if has_nlines[neighbor]:
+                    top = math.ceil(level + 0.5 * nlines[neighbor])
+                    if (level <= base_level) and (base_level < top):
+                        collision = True
+                    top = math.ceil(base_level + 0.5 * nlines[node])
+                    if (base_level <= level) and (level < top):
+                        collision = True
+                elif level == base_level:
+                    collision = True
+                if collision:
+                    base_level += 1
+                    break
+        levels[node] = base_level
+    return levels
@@ -1,29 +1,48 @@
 """Implements the method used for deciding which feature goes to which level
 when plotting."""
 
-import itertools
-import math
+import heapq
 
+import numpy as np
 
-class Graph:
-    """Minimal implementation of non-directional graphs.
+from ._fast import assign_levels
 
-    Parameters
-    ----------
 
-    nodes
-      A list of objects. They must be hashable
-    edges
-      A list of the form [(n1,n2), (n3,n4)...] where (n1, n2) represents
-      an edge between nodes n1 and n2
-    """
+def compute_overlaps_graph(starts, ends):
+    """Return the graph of the overlaps between features, in compressed form.
+
+    `starts` and `ends` are arrays of the features coordinates. Two features
+    overlap in the same sense as in ``GraphicFeature.overlaps_with``.
 
-    def __init__(self, nodes, edges):
-        self.nodes = nodes
-        self.neighbors = {n: [] for n in nodes}
-        for n1, n2 in edges:
-            self.neighbors[n1].append(n2)
-            self.neighbors[n2].append(n1)
+    The result is a couple ``(neighbors_indptr, neighbors)`` of arrays, such
+    that the indices of the features overlapping with feature ``i`` are
+    ``neighbors[neighbors_indptr[i]:neighbors_indptr[i + 1]]``.
+
+    The overlaps are found with a sweep over the features sorted by start,
+    keeping a heap of the features still "open" at the current position, so
+    only the pairs of features which actually overlap are ever considered.
+    """
+    locations = sorted(
+        zip(
+            np.minimum(starts, ends).tolist(),
+            range(len(starts)),
+            np.maximum(starts, ends).tolist(),
+        )
+    )
+    edges = []
+    open_features = []  # heap of (end, index)
+    for start, i, end in locations:
+        while len(open_features) and (open_features[0][0] <= start):
+            heapq.heappop(open_features)
+        edges += [(min(i, j), max(i, j)) for (_, j) in open_features]
+        heapq.heappush(open_features, (end, i))
+    edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    sources = np.concatenate([edges[:, 0], edges[:, 1]])
+    targets = np.concatenate([edges[:, 1], edges[:, 0]])
+    neighbors = targets[np.argsort(sources, kind="stable")]
+    degrees = np.bincount(sources, minlength=len(starts))
+    neighbors_indptr = np.concatenate([[0], np.cumsum(degrees)])
+    return neighbors_indptr.astype(np.int64), neighbors
 
 
 def compute_features_levels(features):
@@ -39,38 +58,27 @@ def compute_features_levels(features):
       corresponding to the largest features.
     - A node receives the lowest level (starting at 0) that is not already
       the level of one of its neighbors.
-    """
-    edges = [
-        (f1, f2)
-        for f1, f2 in itertools.combinations(features, 2)
-        if f1.overlaps_with(f2)
-    ]
-    graph = Graph(features, edges)
-    levels = {n: None for n in graph.nodes}
-
-    def collision(base_level, node):
-        """Return True iff the node placed at base_level collides with
-        its neighbors in the graph."""
-        for neighbor in graph.neighbors[node]:
-            level = levels[neighbor]
-            if level is None:
-                continue
-            if "nlines" in neighbor.data:
-                top = math.ceil(level + 0.5 * neighbor.data["nlines"])
-                if level <= base_level < top:
-                    return True
 
-                top = math.ceil(base_level + 0.5 * node.data["nlines"])
-                if base_level <= level < top:
-                    return True
-            else:
-                if level == base_level:
-                    return True
-        return False
-
-    for node in sorted(graph.nodes, key=lambda f: -f.length):
-        base_level = 0
-        while collision(base_level, node):
-            base_level += 1
-        levels[node] = base_level
-    return levels
+    The levels attribution itself is done by ``_fast.assign_levels``, which
+    is compiled with Numba when Numba is installed.
+    """
+    features = list(features)
+    starts = np.array([f.start for f in features])
+    ends = np.array([f.end for f in features])
+    neighbors_indptr, neighbors = compute_overlaps_graph(starts, ends)
+    lengths = np.abs(ends - starts)
+    order = np.argsort(-lengths, kind="stable")
+    has_nlines = np.array(
+        ["nlines" in f.data for f in features], dtype=np.bool_
+    )
+    nlines = np.array(
+        [f.data.get("nlines", 0) for f in features], dtype=np.float64
+    )
+    levels = assign_levels(
+        order.astype(np.int64),
+        neighbors_indptr,
+        neighbors,
+        nlines,
+        has_nlines,
+    )
+    return {f: int(level) for f, level in zip(features, levels)}
@@ -6,17 +6,18 @@ from dna_features_viewer import BiopythonTranslator
 from Bio import SeqIO
 import numpy as np
 
+# Byte translation table mapping G and C to 1 and all other letters to 0.
+GC_TABLE = bytes([int(chr(i) in "GCgc") for i in range(256)])
+
 
 def plot_local_gc_content(record, window_size, ax):
     """Plot windowed GC content on a designated Matplotlib ax."""
-    def gc_content(s):
-        return 100.0 * len([c for c in s if c in "GC"]) / len(s)
-
-    yy = [
-        gc_content(record.seq[i : i + window_size])
-        for i in range(len(record.seq) - window_size)
-    ]
-    xx = np.arange(len(record.seq) - window_size) + 25
+    sequence = str(record.seq).encode("ascii")
+    gc = np.frombuffer(sequence.translate(GC_TABLE), dtype=np.uint8)
+    gc_cumsum = np.cumsum(np.concatenate([[0], gc]))
+    yy = 100.0 * (gc_cumsum[window_size:] - gc_cumsum[:-window_size])
+    yy /= window_size
+    xx = np.arange(len(yy)) + 25
     ax.fill_between(xx, yy, alpha=0.3)
     ax.set_ylim(bottom=0)
     ax.set_ylabel("GC(%)")
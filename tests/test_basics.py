@@ -71,11 +71,13 @@ def test_plot_with_gc_content(tmpdir):
 
     # Plot the local GC content
     def plot_local_gc_content(record, window_size, ax):
-        def gc_content(seq):
-            return 100.0*len([c for c in seq if c in "GC"]) / len(seq)
-        yy = [gc_content(record.seq[i:i+window_size])
-              for i in range(len(record.seq)-window_size)]
-        xx = np.arange(len(record.seq)-window_size)+25
+        gc_table = bytes([int(chr(i) in "GCgc") for i in range(256)])
+        sequence = str(record.seq).encode("ascii")
+        gc = np.frombuffer(sequence.translate(gc_table), dtype=np.uint8)
+        gc_cumsum = np.cumsum(np.concatenate([[0], gc]))
+        yy = 100.0 * (gc_cumsum[window_size:] -
+                      gc_cumsum[:-window_size]) / window_size
+        xx = np.arange(len(yy))+25
         ax.fill_between(xx, yy, alpha=0.3)
         ax.set_ylabel("GC(%)")
 
@@ -132,6 +134,24 @@ def test_split_overflowing_features():
         (40, 49, 'b')
     ]
 
+def test_split_overflowing_features_keeps_order():
+    features = [
+        GraphicFeature(start=-5, end=10, label="x"),
+        GraphicFeature(start=100, end=200, label="a"),
+        GraphicFeature(start=990, end=1010, label="y"),
+        GraphicFeature(start=300, end=400, label="b"),
+    ]
+    record = GraphicRecord(sequence_length=1000, features=features)
+    record.split_overflowing_features_circularly()
+    assert [(f.label, f.start, f.end) for f in record.features] == [
+        ("x", 995, 999),
+        ("x", 0, 10),
+        ("a", 100, 200),
+        ("y", 990, 999),
+        ("y", 0, 10),
+        ("b", 300, 400),
+    ]
+
 def test_cropping():
     features=[
         GraphicFeature(start=5, end=20, strand=+1, color="#ffd700",
@@ -164,6 +184,17 @@ def test_to_biopython_record():
     ])
     assert features == [(5, 20, 'a'), (20, 500, 'b'), (400, 700, 'c')]
 
+def test_to_biopython_record_to_genbank(tmpdir):
+    record = GraphicRecord(sequence_length=50, features=[
+        GraphicFeature(start=5, end=20, strand=+1, label="a"),
+    ])
+    biopython_record = record.to_biopython_record(sequence=50*"A")
+    target_file = os.path.join(str(tmpdir), "record.gb")
+    SeqIO.write(biopython_record, target_file, "genbank")
+    new_record = SeqIO.read(target_file, "genbank")
+    assert str(new_record.seq) == 50*"A"
+    assert new_record.features[0].qualifiers["label"] == ["a"]
+
 def test_sequence_and_translation_plotting():
     from dna_features_viewer import (GraphicFeature, GraphicRecord,
                                  CircularGraphicRecord)
@@ -178,3 +209,64 @@ def test_sequence_and_translation_plotting():
     ax, _ = record.plot(figure_width=5)
     record.plot_sequence(ax)
     record.plot_translation(ax, (8, 23), fontdict={'weight': 'bold'})
+
+def test_compute_features_levels():
+    features = [
+        GraphicFeature(start=5, end=20, strand=+1, label="a"),
+        GraphicFeature(start=20, end=500, strand=+1, label="b"),
+        GraphicFeature(start=400, end=700, strand=-1, label="c"),
+        GraphicFeature(start=600, end=900, strand=+1, label="d"),
+    ]
+    record = GraphicRecord(sequence_length=1000, features=features)
+    levels = record.compute_features_levels()
+    assert [levels[f] for f in features] == [0, 0, 1, 0]
+
+def test_cropped_feature_is_independent():
+    feature = GraphicFeature(start=5, end=20, strand=+1, label="a",
+                             fontdict={"weight": "bold"}, note="n")
+    cropped = feature.crop((10, 30))
+    assert (cropped.start, cropped.end, cropped.open_left) == (10, 20, True)
+    cropped.data["note"] = "m"
+    cropped.fontdict["weight"] = "normal"
+    assert (feature.start, feature.open_left) == (5, False)
+    assert feature.data["note"] == "n"
+    assert feature.fontdict["weight"] == "bold"
+
+def test_cropping_feature_subclass():
+    class CustomFeature(GraphicFeature):
+        def __init__(self, custom_attribute, **kwargs):
+            GraphicFeature.__init__(self, **kwargs)
+            self.custom_attribute = custom_attribute
+
+    feature = CustomFeature(custom_attribute="x", start=5, end=20, label="a")
+    cropped = feature.crop((10, 30))
+    assert isinstance(cropped, CustomFeature)
+    assert (cropped.custom_attribute, cropped.length) == ("x", 10)
+    assert repr(cropped) == "GF(a, 10-20 )"
+
+def test_cropping_sequence():
+    record = GraphicRecord(sequence=25 * "ATGC", features=[])
+    cropped_record = record.crop((10, 60)).crop((5, 20))
+    assert cropped_record.first_index == 15
+    assert cropped_record.sequence == (25 * "ATGC")[15:30]
+
+def test_features_levels_after_moving_a_feature():
+    features = [
+        GraphicFeature(start=5, end=20, strand=+1, label="a"),
+        GraphicFeature(start=400, end=700, strand=-1, label="b"),
+    ]
+    record = GraphicRecord(sequence_length=1000, features=features)
+    assert list(record.compute_features_levels().values()) == [0, 0]
+    features[0].end = 500
+    assert list(record.compute_features_levels().values()) == [0, 1]
+
+def test_cropping_feature_subclass_with_slots():
+    class SlottedFeature(GraphicFeature):
+        __slots__ = ("custom_attribute", "unset_attribute")
+
+    feature = SlottedFeature(start=5, end=20, label="a")
+    feature.custom_attribute = "x"
+    cropped = feature.crop((10, 30))
+    assert isinstance(cropped, SlottedFeature)
+    assert (cropped.custom_attribute, cropped.start) == ("x", 10)
+    assert not hasattr(cropped, "unset_attribute")